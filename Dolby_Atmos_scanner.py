@@ -1,13 +1,25 @@
 import os
 import sys
 import json
+import orjson
+import msgspec
+import xxhash
 import csv
 import subprocess
+import multiprocessing
 import threading
+import queue
 import traceback
 import time
 import webbrowser
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    # Optional: probes files in-process through libavformat, skipping the
+    # ffprobe process-startup cost entirely. ffprobe remains the fallback.
+    import av
+except ImportError:
+    av = None
 
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
@@ -18,8 +30,23 @@ from tkinter import filedialog, messagebox
 # CONFIG
 # ==========================================================
 VERSION = "1.0"
-VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts"}
-CACHE_FILE = "scan_cache.json"
+VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts"})
+CACHE_FILE = "scan_cache.ndjson"
+LEGACY_CACHE_FILE = "scan_cache.json"  # Pre-NDJSON cache, migrated on first load
+CACHE_VERSION = 3  # Bump when the signature format changes so stale entries are ignored
+CACHE_TTL = 30 * 86400  # Unseen entries older than this are evicted (seconds)
+CACHE_MAX_ENTRIES = 200_000  # Hard cap; least recently seen entries go first
+HASH_CHUNK = 262144  # 256 KiB read from the head and tail of each file
+# Number of parallel ffprobe workers. Half the cores keeps the machine
+# responsive while the scan runs; set the ATMOS_SCANNER_WORKERS environment
+# variable to override (e.g. 1 for spinning disks, more for fast NVMe).
+try:
+    MAX_WORKERS = max(1, int(os.environ["ATMOS_SCANNER_WORKERS"]))
+except (KeyError, ValueError):
+    MAX_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+# Set this environment variable to force the ffprobe subprocess path even
+# when PyAV is installed (e.g. to rule out PyAV when debugging a file)
+FORCE_FFPROBE_ENV = "ATMOS_SCANNER_FFPROBE"
 DEFAULT_LANG = "en"
 GITHUB_REPO = "https://github.com/Liozon/Dolby-Atmos-scanner"
 
@@ -71,118 +98,405 @@ def load_translation(lang):
 # ==========================================================
 # CACHE
 # ==========================================================
+# Cache-file lines superseded by a later append for the same key, counted
+# during load; used to decide whether compaction is worth a full rewrite
+_dead_records = 0
+
 def load_cache():
     """
-    Loads the scan cache from disk. The cache stores previously scanned video
-    file information to avoid rescanning unchanged files.
-    
+    Loads the scan cache from disk. The cache is stored as JSON Lines: a
+    version header followed by one record per file, so it can be read and
+    appended to incrementally instead of parsed/rewritten as one big blob.
+    Later lines win, which is what makes plain appends during a scan safe.
+
     Returns:
-        Dictionary containing cached scan results, or empty dict if cache doesn't exist
+        Dictionary mapping file path to cached scan entry, or empty dict if
+        the cache doesn't exist or was written with an older signature format
     """
+    global _dead_records
+    _dead_records = 0
+    cache = {}
+    if not os.path.exists(CACHE_FILE) and os.path.exists(LEGACY_CACHE_FILE):
+        return _migrate_legacy_cache()
     if os.path.exists(CACHE_FILE):
-        with open(CACHE_FILE, encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+        with open(CACHE_FILE, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    rec = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Truncated tail from an interrupted scan: skip it
+                    continue
+                if "version" in rec:
+                    # A cache from another version is useless: its signatures
+                    # would never match the current format. Rewrite the file
+                    # with a fresh header right away, otherwise later appends
+                    # would land under the stale header and be discarded by
+                    # every subsequent load
+                    if rec["version"] != CACHE_VERSION:
+                        compact_cache({})
+                        return {}
+                    continue
+                if rec["key"] in cache:
+                    _dead_records += 1
+                cache[rec["key"]] = {
+                    "sig": rec["sig"],
+                    "tracks": rec["tracks"],
+                    "seen": rec.get("seen", 0),
+                }
+    return cache
 
-def save_cache(cache):
+def _migrate_legacy_cache():
     """
-    Saves the scan cache to disk as a JSON file.
-    
+    One-time migration of the old monolithic scan_cache.json into the NDJSON
+    format. Entries are only kept if the old file carries the current schema
+    version (older size_mtime signatures would never match anyway). The
+    legacy file is removed afterwards so this runs once.
+
+    Returns:
+        Dictionary of migrated cache entries, or empty dict
+    """
+    cache = {}
+    try:
+        with open(LEGACY_CACHE_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+        if data.get("version") == CACHE_VERSION:
+            cache = data.get("files", {})
+    except Exception:
+        pass
+    try:
+        os.remove(LEGACY_CACHE_FILE)
+    except OSError:
+        pass
+    if cache:
+        compact_cache(cache)
+    return cache
+
+def append_cache(key, entry):
+    """
+    Appends a single freshly computed entry to the cache file. Called as each
+    probe completes, so an interrupted scan keeps everything probed so far.
+
+    Args:
+        key: File path used as the cache key
+        entry: Dictionary with "sig" and "tracks" for that file
+    """
+    is_new = not os.path.exists(CACHE_FILE)
+    with open(CACHE_FILE, "ab") as f:
+        if is_new:
+            f.write(orjson.dumps({"version": CACHE_VERSION}) + b"\n")
+        f.write(orjson.dumps({"key": key, **entry}) + b"\n")
+
+def compact_cache(cache):
+    """
+    Rewrites the cache file from the in-memory dict, dropping superseded
+    duplicate lines accumulated by appends. Run once at the end of a scan.
+
     Args:
         cache: Dictionary containing scan results to be cached
     """
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2)
+    with open(CACHE_FILE, "wb") as f:
+        f.write(orjson.dumps({"version": CACHE_VERSION}) + b"\n")
+        for key, entry in cache.items():
+            f.write(orjson.dumps({"key": key, **entry}) + b"\n")
 
-def file_signature(path):
+def file_signature(entry):
     """
-    Creates a unique signature for a file based on its size and modification time.
-    This is used to detect if a file has changed since it was last scanned.
-    
+    Creates a unique signature for a file based on its size, inode and a fast
+    content hash of its first and last 256 KiB. Unlike mtime, this detects
+    real content changes (and ignores mtime-only changes from copies,
+    backups or filesystems that preserve timestamps). The inode term catches
+    a file being replaced in place, but only on POSIX: on Windows,
+    DirEntry.stat() always reports st_ino as 0, so there replacements are
+    detected by size/content alone. Hashing only the head and tail keeps
+    I/O to a few hundred KiB per file instead of reading everything.
+
     Args:
-        path: Path to the file
-    
+        entry: os.DirEntry for the file, so the stat result cached during
+               directory iteration is reused instead of a second syscall
+
     Returns:
-        String signature in format "size_mtime"
+        [size, inode, content_hash] as plain integers. A list rather than a
+        formatted string: no per-file string building, exact integer
+        comparison, and it round-trips through the JSON cache unchanged
     """
-    st = os.stat(path)
-    return f"{st.st_size}_{st.st_mtime}"
+    st = entry.stat()
+    size = st.st_size
+    h = xxhash.xxh3_64()
+    with open(entry.path, "rb") as f:
+        h.update(f.read(HASH_CHUNK))
+        # Only hash the tail separately if it doesn't overlap the head
+        if size > 2 * HASH_CHUNK:
+            f.seek(-HASH_CHUNK, os.SEEK_END)
+            h.update(f.read(HASH_CHUNK))
+    return [size, st.st_ino, h.intdigest()]
 
 # ==========================================================
 # AUDIO SCAN
 # ==========================================================
-def scan_video(path, cache):
+# E-AC-3 codec names as ffprobe may report them; hoisted out of the
+# per-stream loop in probe_file
+_EAC3 = frozenset({"eac3", "e-ac-3"})
+
+class Stream(msgspec.Struct):
+    """One audio stream as reported by ffprobe (only the fields we read)."""
+    codec_name: str = ""
+    profile: str = ""
+    tags: dict = {}
+
+class Probe(msgspec.Struct):
+    """Top-level ffprobe JSON output."""
+    streams: list[Stream] = []
+
+def _classify_stream(codec, profile, lang):
     """
-    Scans a video file to detect spatial audio formats (Dolby Atmos, DTS:X).
-    Uses ffprobe to analyze audio streams and identifies advanced audio codecs.
-    Results are cached to avoid rescanning unchanged files.
-    
+    Classifies one audio stream, given already-lowercased codec and profile.
+
     Args:
-        path: Path to the video file
-        cache: Cache dictionary to store/retrieve results
-    
+        codec: Codec name (e.g. "truehd", "eac3", "dts")
+        profile: Codec profile string
+        lang: Language tag
+
     Returns:
-        List of tuples containing (format, language, codec, profile) for each spatial audio track
+        A (format, language, codec, profile) tuple for spatial audio tracks,
+        or None for everything else
     """
-    sig = file_signature(path)
-    key = str(path)
+    match (codec, profile):
+        # Detect Dolby Atmos (TrueHD or any codec advertising an Atmos profile)
+        case (_, p) if "atmos" in p:
+            return ("Dolby Atmos", lang, codec, profile)
+        # Detect Dolby Atmos (E-AC-3 with JOC - Joint Object Coding)
+        case (c, p) if c in _EAC3 and "joc" in p:
+            return ("Dolby Atmos", lang, codec, profile)
+        # Detect DTS:X
+        case ("dts", p) if "x" in p:
+            return ("DTS:X", lang, codec, profile)
+        case _:
+            return None
 
-    # Return cached result if file hasn't changed
-    if key in cache and cache[key]["sig"] == sig:
-        return cache[key]["tracks"]
+def probe_file(path):
+    """
+    Probes a video file to detect spatial audio formats (Dolby Atmos, DTS:X).
+    Reads stream metadata in-process through PyAV when it is installed,
+    avoiding one ffprobe process spawn (plus DLL load on Windows) per file;
+    otherwise falls back to the bundled ffprobe. This is a top-level function
+    so it can be pickled and run in worker processes; cache lookups happen in
+    the parent before submission.
 
-    # Build ffprobe command to extract audio stream information
+    Args:
+        path: Path to the video file (string)
+
+    Returns:
+        List of tuples containing (format, language, codec, profile) for each
+        spatial audio track, or None if the probe failed. Failures must stay
+        distinguishable from "no spatial tracks" so they are never cached:
+        a cached [] would suppress retries until the file content changes
+    """
+    if av is not None and not os.environ.get(FORCE_FFPROBE_ENV):
+        return _probe_av(path)
+    return _probe_ffprobe(path)
+
+def _probe_av(path):
+    """
+    Probes a file through PyAV (libavformat bound in-process).
+
+    Args:
+        path: Path to the video file (string)
+
+    Returns:
+        List of spatial audio track tuples, or None if the file could not
+        be opened or read
+    """
+    try:
+        container = av.open(path, metadata_errors="ignore")
+    except Exception:
+        return None
+    tracks = []
+    try:
+        for s in container.streams.audio:
+            codec = s.codec_context.name.lower()
+            profile = (s.codec_context.profile or "").lower()
+            lang = (s.metadata or {}).get("language", "unknown")
+            t = _classify_stream(codec, profile, lang)
+            if t:
+                tracks.append(t)
+    except Exception:
+        return None
+    finally:
+        container.close()
+    return tracks
+
+def _launch_probe(path):
+    """
+    Starts an ffprobe process for a file without waiting for it, so the
+    caller can overlap its runtime with other work.
+
+    Args:
+        path: Path to the video file (string)
+
+    Returns:
+        The started subprocess.Popen, or None if it could not be launched
+    """
+    # Build ffprobe command to extract audio stream information.
+    # Only the three fields we actually read are requested: -show_streams
+    # would dump every tag and disposition block as kilobytes of JSON per
+    # file, all of it parsed just to be thrown away.
     cmd = [
         FFPROBE, "-v", "error",
         "-select_streams", "a",  # Select only audio streams
-        "-show_streams",
+        "-show_entries", "stream=codec_name,profile:stream_tags=language",
+        "-probesize", "5M",  # Container headers are enough; don't read further
+        "-analyzeduration", "5M",
+        "-threads", "1",  # Parallelism comes from the worker pool, not ffprobe
         "-of", "json",
-        str(path)
+        path
     ]
 
     try:
-        proc = subprocess.run(
+        # Binary pipe straight into msgspec: no per-chunk str decode, and
+        # stderr goes to DEVNULL so thousands of probes don't accumulate
+        # (or block on) ffprobe warning output
+        return subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             creationflags=subprocess.CREATE_NO_WINDOW
         )
-        data = json.loads(proc.stdout)
     except Exception:
-        return []
+        return None
+
+def _collect_probe(proc):
+    """
+    Waits for a launched ffprobe, parses its output and classifies the
+    streams.
+
+    Args:
+        proc: Popen from _launch_probe, or None if the launch failed
+
+    Returns:
+        List of spatial audio track tuples, or None on any probe error
+    """
+    if proc is None:
+        return None
+    try:
+        try:
+            out, _ = proc.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            # A wedged ffprobe must not hang the whole scan
+            proc.kill()
+            proc.communicate()
+            return None
+        data = msgspec.json.decode(out, type=Probe)
+    except Exception:
+        return None
 
     tracks = []
-    for s in data.get("streams", []):
-        codec = s.get("codec_name", "").lower()
-        profile = s.get("profile", "").lower()
-        lang = s.get("tags", {}).get("language", "unknown")
-
-        # Detect Dolby Atmos (TrueHD with Atmos profile)
-        if "atmos" in profile or (codec == "truehd" and "atmos" in profile):
-            tracks.append(("Dolby Atmos", lang, codec, profile))
-        # Detect Dolby Atmos (E-AC-3 with JOC - Joint Object Coding)
-        elif codec in {"eac3", "e-ac-3"} and "joc" in profile:
-            tracks.append(("Dolby Atmos", lang, codec, profile))
-        # Detect DTS:X
-        elif codec == "dts" and "x" in profile:
-            tracks.append(("DTS:X", lang, codec, profile))
+    for s in data.streams:
+        codec = s.codec_name.lower()
+        profile = s.profile.lower()
+        lang = s.tags.get("language", "unknown")
+        t = _classify_stream(codec, profile, lang)
+        if t:
+            tracks.append(t)
 
-    # Cache the results
-    cache[key] = {"sig": sig, "tracks": tracks}
     return tracks
 
+def _probe_ffprobe(path):
+    """
+    Probes a file with the bundled ffprobe executable.
+
+    Args:
+        path: Path to the video file (string)
+
+    Returns:
+        List of spatial audio track tuples, or None on any probe error
+    """
+    return _collect_probe(_launch_probe(path))
+
 # ==========================================================
 # FOLDER SCAN
 # ==========================================================
+def _walk(root):
+    """
+    Walks a folder tree with os.scandir, yielding os.DirEntry objects for
+    video files. DirEntry carries the stat result from directory iteration,
+    so the signature check later doesn't need a second stat() per file, and
+    no Path objects are allocated in the hot loop.
+
+    Args:
+        root: Folder path to walk
+
+    Yields:
+        os.DirEntry for each video file found
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                        continue
+                except OSError:
+                    continue
+                dot = e.name.rfind(".")
+                if dot != -1 and e.name[dot:].lower() in VIDEO_EXTENSIONS:
+                    yield e
+
+def _scan_pipelined(pending):
+    """
+    Single-worker scan path. With only one worker (MAX_WORKERS == 1, e.g.
+    spinning disks where parallel probes thrash the head) a process pool
+    degenerates to strictly serial ffprobe runs. Instead, a small producer
+    thread launches the probe for the next file into a bounded queue while
+    the current one's output is still being awaited and parsed, hiding the
+    probe latency behind the parse. With PyAV active there is no subprocess
+    to overlap, so files are simply probed in order.
+
+    Args:
+        pending: List of (key, sig) pairs for files needing a probe
+
+    Yields:
+        (key, sig, tracks) for each probed file
+    """
+    if av is not None and not os.environ.get(FORCE_FFPROBE_ENV):
+        for key, sig in pending:
+            yield key, sig, _probe_av(key)
+        return
+
+    # maxsize=2 keeps exactly one probe in flight ahead of the consumer
+    q = queue.Queue(maxsize=2)
+
+    def producer():
+        for key, sig in pending:
+            q.put((key, sig, _launch_probe(key)))
+        q.put(None)
+
+    threading.Thread(target=producer, daemon=True).start()
+    while True:
+        item = q.get()
+        if item is None:
+            break
+        key, sig, proc = item
+        yield key, sig, _collect_probe(proc)
+
 def scan_folders(folders, progress_cb):
     """
     Scans multiple folders recursively for video files and analyzes their audio tracks.
-    Calls the progress callback function to update the UI during scanning.
-    
+    Files whose signature matches the cache are answered immediately; the rest
+    are probed in parallel by a pool of worker processes so several ffprobe
+    instances run at once. Calls the progress callback function to update the
+    UI during scanning.
+
     Args:
         folders: List of folder paths to scan
         progress_cb: Callback function called with (current, total) to report progress
-    
+
     Returns:
         List of tuples containing (file_path, format, language, codec, profile) for all detected tracks
     """
@@ -192,21 +506,112 @@ def scan_folders(folders, progress_cb):
     # Collect all video files from all folders
     files = []
     for folder in folders:
-        files.extend(
-            f for f in Path(folder).rglob("*")
-            if f.suffix.lower() in VIDEO_EXTENSIONS
-        )
+        files.extend(_walk(folder))
 
     total = len(files)
+    done = 0
+    scan_time = time.time()
+
+    # Answer cache hits directly; only changed/new files go to the pool
+    pending = []
+    stale_touches = 0
+    for entry in files:
+        key = entry.path
+        try:
+            sig = file_signature(entry)
+        except OSError:
+            # File vanished or is unreadable: count it and move on
+            done += 1
+            progress_cb(done, total)
+            continue
+        if key in cache and cache[key]["sig"] == sig:
+            # Touch for LRU eviction. The refresh only reaches disk through
+            # compaction, so count touches whose stored timestamp has aged
+            # past half the TTL: an all-hits scan must still compact before
+            # the TTL can evict entries that are in fact seen regularly
+            if scan_time - cache[key].get("seen", 0) > CACHE_TTL / 2:
+                stale_touches += 1
+            cache[key]["seen"] = scan_time
+            for t in cache[key]["tracks"]:
+                results.append((key, *t))
+            done += 1
+            progress_cb(done, total)
+        else:
+            pending.append((key, sig))
+
+    # Appends for keys already on disk leave a dead line behind; counted
+    # towards the compaction decision below
+    superseded = sum(1 for key, _ in pending if key in cache)
 
-    # Scan each file and collect results
-    for i, file in enumerate(files, 1):
-        tracks = scan_video(file, cache)
-        for t in tracks:
-            results.append((str(file), *t))
-        progress_cb(i, total)
+    # Probe the remaining files in parallel, bounded by MAX_WORKERS so the
+    # machine stays usable during a full-tree rescan. With a single worker
+    # the pool would serialize anyway, so a cheaper double-buffered pipeline
+    # overlaps each probe with the previous parse instead.
+    if pending:
+        if MAX_WORKERS > 1:
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(probe_file, key): (key, sig)
+                    for key, sig in pending
+                }
+                for future in as_completed(futures):
+                    key, sig = futures[future]
+                    try:
+                        tracks = future.result()
+                    except Exception:
+                        tracks = None
+                    if tracks is None:
+                        # Failed probe: leave the file uncached so the next
+                        # scan retries instead of trusting an empty result
+                        done += 1
+                        progress_cb(done, total)
+                        continue
+                    cache[key] = {"sig": sig, "tracks": tracks, "seen": time.time()}
+                    # Persist immediately so an interrupted scan loses nothing
+                    append_cache(key, cache[key])
+                    for t in tracks:
+                        results.append((key, *t))
+                    done += 1
+                    progress_cb(done, total)
+        else:
+            for key, sig, tracks in _scan_pipelined(pending):
+                if tracks is None:
+                    # Failed probe: leave the file uncached so the next
+                    # scan retries instead of trusting an empty result
+                    done += 1
+                    progress_cb(done, total)
+                    continue
+                cache[key] = {"sig": sig, "tracks": tracks, "seen": time.time()}
+                # Persist immediately so an interrupted scan loses nothing
+                append_cache(key, cache[key])
+                for t in tracks:
+                    results.append((key, *t))
+                done += 1
+                progress_cb(done, total)
 
-    save_cache(cache)
+    # Evict entries for files that are gone and haven't been seen within the
+    # TTL, then cap the cache so long-lived installs stay bounded. Files in
+    # the scanned folders are always kept regardless of age.
+    now = time.time()
+    scanned = {e.path for e in files}
+    before = len(cache)
+    cache = {
+        k: v for k, v in cache.items()
+        if k in scanned or now - v.get("seen", 0) < CACHE_TTL
+    }
+    if len(cache) > CACHE_MAX_ENTRIES:
+        newest = sorted(
+            cache.items(), key=lambda kv: kv[1].get("seen", 0), reverse=True
+        )
+        cache = dict(newest[:CACHE_MAX_ENTRIES])
+    evicted = before - len(cache)
+
+    # Rewriting the file every scan would defeat the append-only format:
+    # compact only when eviction dropped entries, when hits need their aging
+    # last-seen timestamps persisted, or when dead lines (superseded by
+    # newer appends) outnumber the live ones
+    if evicted or stale_touches or _dead_records + superseded > len(cache):
+        compact_cache(cache)
     return results
 
 # ==========================================================
@@ -224,7 +629,22 @@ class ScannerGUI:
         self.folders = []  # List of folders to scan
         self.results = []  # Scan results
         self.scan_start_time = None  # Track scan duration
-        self.last_update_time = None  # For throttling time display updates
+        self._progress_q = queue.Queue()  # Worker -> UI progress updates
+        self._scanning = False  # Keeps the progress drain loop alive
+        self._translatable = {}  # widget -> translation key, for in-place language change
+        self._shown_count = None  # Result count in the status bar, None before first scan
+        self._populate_token = 0  # Invalidates in-flight batched treeview inserts
+        self._by_lang = {}  # Results indexed by lowercased language, "" = all
+        self._filter_after = None  # Pending after() id for the filter debounce
+        # Treeview columns: (translation key, width). The keys double as the
+        # stable Tk column identifiers so headings can be retranslated in place
+        self._tree_cols = [
+            ("col_file", 550),
+            ("col_format", 120),
+            ("col_lang", 80),
+            ("col_codec", 100),
+            ("col_profile", 200),
+        ]
 
         # UI language and language filter variables
         self.lang_ui = tb.StringVar(value=DEFAULT_LANG)
@@ -245,6 +665,21 @@ class ScannerGUI:
         """
         return self.trans.get(key, key)
 
+    def _register(self, widget, key):
+        """
+        Tracks a widget whose text must be re-applied when the UI language
+        changes, so change_language can retranslate in place.
+
+        Args:
+            widget: The widget showing a translated text
+            key: Translation key for that text
+
+        Returns:
+            The widget, for call chaining
+        """
+        self._translatable[widget] = key
+        return widget
+
     def build_ui(self):
         """
         Builds the entire user interface including:
@@ -256,7 +691,11 @@ class ScannerGUI:
         - Export buttons
         - Status bar with About link
         """
-        self.root.title(f"{self.tr('title')} - v{VERSION}")
+        # Bind the dict lookup once instead of going through self.tr for
+        # every widget below; T(key, key) falls back to the key like tr does
+        T = self.trans.get
+
+        self.root.title(f"{T('title', 'title')} - v{VERSION}")
         try:
             self.root.iconbitmap(ICON_PATH)
         except Exception:
@@ -266,8 +705,10 @@ class ScannerGUI:
         top = tb.Frame(self.root, padding=10)
         top.pack(fill=X)
 
-        tb.Button(top, text=self.tr("add_folder"),
-                  command=self.add_folder).pack(side=LEFT)
+        self._register(
+            tb.Button(top, text=T("add_folder", "add_folder"), command=self.add_folder),
+            "add_folder"
+        ).pack(side=LEFT)
 
         tb.Label(top, text="UI language:").pack(side=LEFT, padx=10)
         lang_sel = tb.Combobox(
@@ -278,8 +719,14 @@ class ScannerGUI:
         lang_sel.pack(side=LEFT)
         lang_sel.bind("<<ComboboxSelected>>", self.change_language)
 
-        tb.Label(top, text=self.tr("language_filter")).pack(side=LEFT, padx=10)
-        tb.Entry(top, textvariable=self.lang_filter, width=10).pack(side=LEFT)
+        self._register(
+            tb.Label(top, text=T("language_filter", "language_filter")),
+            "language_filter"
+        ).pack(side=LEFT, padx=10)
+        filter_entry = tb.Entry(top, textvariable=self.lang_filter, width=10)
+        filter_entry.pack(side=LEFT)
+        # Live filtering: refresh the results shortly after typing pauses
+        filter_entry.bind("<KeyRelease>", self._on_filter_change)
 
         # FOLDER LIST
         lf = tb.Labelframe(self.root, text="Folders to scan", padding=10)
@@ -292,25 +739,35 @@ class ScannerGUI:
         sb.pack(side=RIGHT, fill=Y)
         self.folder_list.config(yscrollcommand=sb.set)
 
-        tb.Button(
-            lf,
-            text=self.tr("remove_selected"),
-            bootstyle=DANGER,
-            command=self.remove_folder
+        self._register(
+            tb.Button(
+                lf,
+                text=T("remove_selected", "remove_selected"),
+                bootstyle=DANGER,
+                command=self.remove_folder
+            ),
+            "remove_selected"
         ).pack(side=RIGHT, padx=5)
 
         # SCAN BUTTON
-        tb.Button(self.root, text=self.tr("scan"),
-                  bootstyle=SUCCESS,
-                  command=self.run_scan).pack(pady=5)
+        self._register(
+            tb.Button(self.root, text=T("scan", "scan"),
+                      bootstyle=SUCCESS,
+                      command=self.run_scan),
+            "scan"
+        ).pack(pady=5)
 
         # RESULTS TREEVIEW
-        cols = (self.tr("col_file"), self.tr("col_format"), self.tr("col_lang"), self.tr("col_codec"), self.tr("col_profile"))
+        # Column identifiers are the translation keys; only the visible
+        # heading text is translated. Title-cased headings are computed once
+        # and reused on language change
+        self._col_titles = {key: T(key, key).title() for key, _ in self._tree_cols}
+        cols = tuple(key for key, _ in self._tree_cols)
         self.tree = tb.Treeview(self.root, columns=cols, show="headings")
 
-        for c, w in zip(cols, (550, 120, 80, 100, 200)):
-            self.tree.heading(c, text=c.title())
-            self.tree.column(c, width=w)
+        for key, w in self._tree_cols:
+            self.tree.heading(key, text=self._col_titles[key])
+            self.tree.column(key, width=w)
 
         self.tree.pack(fill=BOTH, expand=True, padx=10)
 
@@ -328,25 +785,34 @@ class ScannerGUI:
         bottom = tb.Frame(self.root, padding=10)
         bottom.pack(fill=X)
 
-        tb.Button(bottom, text=self.tr("export_txt"),
-                  command=self.export_txt).pack(side=LEFT)
-        tb.Button(bottom, text=self.tr("export_csv"),
-                  command=self.export_csv).pack(side=LEFT, padx=5)
+        self._register(
+            tb.Button(bottom, text=T("export_txt", "export_txt"),
+                      command=self.export_txt),
+            "export_txt"
+        ).pack(side=LEFT)
+        self._register(
+            tb.Button(bottom, text=T("export_csv", "export_csv"),
+                      command=self.export_csv),
+            "export_csv"
+        ).pack(side=LEFT, padx=5)
 
         # STATUS BAR WITH ABOUT LINK
         status_frame = tb.Frame(self.root)
         status_frame.pack(fill=X, padx=10)
         
-        self.status = tb.Label(status_frame, text=self.tr("ready"), anchor=W)
+        self.status = tb.Label(status_frame, text=T("ready", "ready"), anchor=W)
         self.status.pack(side=LEFT, fill=X, expand=True)
-        
+
         # About link (styled as a link)
-        self.about_link = tb.Label(
-            status_frame, 
-            text=self.tr("about"),
-            foreground="#3498db",
-            cursor="hand2",
-            anchor=E
+        self.about_link = self._register(
+            tb.Label(
+                status_frame,
+                text=T("about", "about"),
+                foreground="#3498db",
+                cursor="hand2",
+                anchor=E
+            ),
+            "about"
         )
         self.about_link.pack(side=RIGHT, padx=5)
         self.about_link.bind("<Button-1>", lambda e: self.show_about())
@@ -452,43 +918,31 @@ class ScannerGUI:
 
     def change_language(self, _=None):
         """
-        Changes the UI language by reloading translations and rebuilding the interface.
-        Preserves the current state (folders, results, filters) during the transition.
-        
+        Changes the UI language by re-applying translations to the existing
+        widgets in place. Folders, results and the treeview rows are left
+        untouched: rebuilding the whole interface (and re-inserting thousands
+        of result rows) froze the app for seconds after a large scan.
+
         Args:
             _: Event parameter (unused, from combobox selection event)
         """
-        # Save current state
-        saved_folders = self.folders.copy()
-        saved_results = self.results.copy()
-        saved_lang_filter = self.lang_filter.get()
-        saved_lang_ui = self.lang_ui.get()
-        
-        # Load new translation
-        self.trans = load_translation(saved_lang_ui)
-        
-        # Destroy all widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Recreate variables (they're bound to destroyed widgets)
-        self.lang_ui = tb.StringVar(value=saved_lang_ui)
-        self.lang_filter = tb.StringVar(value=saved_lang_filter)
-        
-        # Rebuild interface
-        self.build_ui()
-        
-        # Restore state
-        self.folders = saved_folders
-        self.results = saved_results
-        
-        # Repopulate folder list
-        for folder in self.folders:
-            self.folder_list.insert(tk.END, folder)
-        
-        # Repopulate results if present
-        if self.results:
-            self.populate()
+        self.trans = load_translation(self.lang_ui.get())
+
+        T = self.trans.get
+        self.root.title(f"{T('title', 'title')} - v{VERSION}")
+        for widget, key in self._translatable.items():
+            widget.config(text=T(key, key))
+        self._col_titles = {key: T(key, key).title() for key, _ in self._tree_cols}
+        for key, _w in self._tree_cols:
+            self.tree.heading(key, text=self._col_titles[key])
+
+        # The status bar text depends on scan state, not a single key
+        if self._scanning:
+            self.status.config(text=T("scanning", "scanning"))
+        elif self._shown_count is not None:
+            self.status.config(text=f"{T('done', 'done')} — {self._shown_count}")
+        else:
+            self.status.config(text=T("ready", "ready"))
 
     def add_folder(self):
         """
@@ -539,96 +993,204 @@ class ScannerGUI:
         if not self.folders:
             messagebox.showwarning("Warning", self.tr("no_folder"))
             return
-        threading.Thread(target=self._scan, daemon=True).start()
-
-    def _scan(self):
-        """
-        Performs the actual scanning operation. This runs in a background thread.
-        Clears previous results, updates progress bar, calculates time estimates,
-        and populates the results when complete.
-        """
+        # Reset the UI here on the main thread; the worker never touches Tk
         self.tree.delete(*self.tree.get_children())
+        self._populate_token += 1  # Stop any batched inserts still pending
         self.results.clear()
         self.status.config(text=self.tr("scanning"))
         self.progress["value"] = 0
         self.scan_start_time = time.time()
-        self.last_update_time = self.scan_start_time
+        self._scanning = True
+        # Start the drain loop before the worker so no update is missed
+        self.root.after(100, self._drain_progress)
+        threading.Thread(target=self._scan, daemon=True).start()
+
+    def _drain_progress(self):
+        """
+        Polls the progress queue on the Tk main loop (10 Hz) and applies only
+        the most recent update. The scan worker never touches Tk directly:
+        posting one after(0) callback per scanned file flooded the event loop
+        on large libraries, while a fixed-rate drain keeps the UI fluid.
+        Reschedules itself until the scan ends and the queue is empty.
+        """
+        last = None
+        while True:
+            try:
+                last = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+        if last is not None:
+            cur, tot, now = last
+            self.progress["maximum"] = tot
+            self.progress["value"] = cur
+            if cur > 0:
+                # Estimate remaining time from the average pace so far
+                elapsed = now - self.scan_start_time
+                estimated_remaining = (elapsed / cur) * (tot - cur)
+                self.time_label.config(
+                    text=f"~{self.format_time(estimated_remaining)}"
+                )
+        if self._scanning or not self._progress_q.empty():
+            self.root.after(100, self._drain_progress)
+        else:
+            # Scan finished and the queue is drained: clear the time estimate
+            # here, where it cannot race a later drain tick rewriting it
+            self.time_label.config(text="")
 
+    def _scan(self):
+        """
+        Performs the actual scanning operation. This runs in a background
+        thread and stays off Tk entirely: the UI was reset by run_scan,
+        progress goes through the queue, and completion is scheduled with
+        root.after. Builds the language index and populates when complete.
+        """
         def prog(cur, tot):
             """
-            Progress callback that updates the progress bar and time estimate.
-            
+            Progress callback: just enqueues the update for the main-loop
+            drain, so the worker thread never calls into Tk.
+
             Args:
                 cur: Current file number
                 tot: Total number of files
             """
-            self.progress["maximum"] = tot
-            self.progress["value"] = cur
-            
-            # Calculate remaining time
-            now = time.time()
-            elapsed = now - self.scan_start_time
-            
-            if cur > 0:
-                avg_time_per_file = elapsed / cur
-                remaining_files = tot - cur
-                estimated_remaining = avg_time_per_file * remaining_files
-                
-                # Update time display (throttled to every 0.5s to avoid flickering)
-                if now - self.last_update_time > 0.5:
-                    self.root.after(0, lambda: self.time_label.config(
-                        text=f"~{self.format_time(estimated_remaining)}"
-                    ))
-                    self.last_update_time = now
+            self._progress_q.put_nowait((cur, tot, time.time()))
 
         self.results = scan_folders(self.folders, prog)
+
+        # Index results by language once, so filter changes are a dict
+        # lookup instead of a pass over every row
+        by_lang = {}
+        for r in self.results:
+            by_lang.setdefault(r[2].lower(), []).append(r)
+        by_lang[""] = self.results
+        self._by_lang = by_lang
+
+        self._scanning = False
         self.root.after(0, self.populate)
-        self.root.after(0, lambda: self.time_label.config(text=""))
 
     def populate(self):
         """
         Populates the results treeview with scan results.
-        Applies the language filter if one is specified.
+        The rows matching the language filter come straight from the
+        per-language index, then are inserted in batches so the event loop
+        is never blocked for long.
         Updates the status bar with the count of displayed results.
         """
+        self.tree.delete(*self.tree.get_children())
         lf = self.lang_filter.get().lower().strip()
-        count = 0
-        for r in self.results:
-            # Apply language filter if specified
-            if lf and r[2].lower() != lf:
-                continue
-            self.tree.insert("", END, values=r)
-            count += 1
-        self.status.config(text=f"{self.tr('done')} — {count}")
+        rows = self._by_lang.get(lf, [])
+        self._shown_count = len(rows)
+        self.status.config(text=f"{self.tr('done')} — {len(rows)}")
+        # Invalidate any batch insertion still in flight from a previous run
+        self._populate_token += 1
+        self._insert_rows(rows, 0, self._populate_token)
+
+    def _insert_rows(self, rows, start, token):
+        """
+        Inserts one 500-row slice into the treeview, then reschedules itself
+        via after_idle. Inserting rows one by one for thousands of results
+        kept the event loop busy in a single long callback; slicing keeps the
+        UI responsive while large result sets stream in.
+
+        Args:
+            rows: Full list of rows to insert
+            start: Index of the first row of this slice
+            token: Populate generation; stale slices are dropped
+        """
+        if token != self._populate_token:
+            return
+        insert = self.tree.insert
+        end = min(start + 500, len(rows))
+        for r in rows[start:end]:
+            insert("", END, values=r)
+        if end < len(rows):
+            self.root.after_idle(lambda: self._insert_rows(rows, end, token))
+
+    def _on_filter_change(self, _=None):
+        """
+        Debounces language-filter keystrokes: each key press resets a short
+        timer so the treeview is repopulated once typing pauses, not on
+        every character.
+
+        Args:
+            _: Event parameter (unused, from the entry's KeyRelease binding)
+        """
+        if self._filter_after is not None:
+            self.root.after_cancel(self._filter_after)
+        self._filter_after = self.root.after(300, self._apply_filter)
+
+    def _apply_filter(self):
+        """
+        Applies the language filter after the debounce delay. Skipped while
+        a scan is running (the scan's own populate will use the new filter)
+        and before any scan has run, so typing in the entry doesn't flip the
+        status bar to a completed-scan state with nothing scanned.
+        """
+        self._filter_after = None
+        if not self._scanning and self._by_lang:
+            self.populate()
 
     def export_txt(self):
         """
         Exports scan results to a plain text file.
-        Each result is written as a pipe-separated line.
+        Each result is written as a pipe-separated line. The write happens in
+        a background thread so a large export doesn't stall the main loop.
         """
         if not self.results:
             return
         p = filedialog.asksaveasfilename(defaultextension=".txt")
         if not p:
             return
-        with open(p, "w", encoding="utf-8") as f:
-            for r in self.results:
-                f.write(" | ".join(r) + "\n")
+        # Snapshot the rows on the main thread: a scan started mid-export
+        # clears self.results under the worker otherwise
+        rows = list(self.results)
+        threading.Thread(target=self._do_export_txt, args=(p, rows), daemon=True).start()
+
+    def _do_export_txt(self, path, rows):
+        """
+        Writes the TXT export as a single buffered write instead of one
+        write call per row. Runs in a background thread.
+
+        Args:
+            path: Destination file path
+            rows: Snapshot of the result rows to write
+        """
+        # Result fields are all strings already (the path comes from
+        # DirEntry.path), so no per-field str() conversion is needed
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write("\n".join(" | ".join(r) for r in rows) + "\n")
+        self.root.after(0, lambda: self.status.config(text=self.tr("export_done")))
 
     def export_csv(self):
         """
         Exports scan results to a CSV file with headers.
         Includes columns: File, Format, Language, Codec, Profile.
+        The write happens in a background thread to keep the UI responsive.
         """
         if not self.results:
             return
         p = filedialog.asksaveasfilename(defaultextension=".csv")
         if not p:
             return
-        with open(p, "w", newline="", encoding="utf-8") as f:
+        # Snapshot the rows on the main thread: a scan started mid-export
+        # clears self.results under the worker otherwise
+        rows = list(self.results)
+        threading.Thread(target=self._do_export_csv, args=(p, rows), daemon=True).start()
+
+    def _do_export_csv(self, path, rows):
+        """
+        Writes the CSV export with a 1 MiB buffer so writerows batches into
+        few large writes. Runs in a background thread.
+
+        Args:
+            path: Destination file path
+            rows: Snapshot of the result rows to write
+        """
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             w = csv.writer(f)
             w.writerow(["File", "Format", "Language", "Codec", "Profile"])
-            w.writerows(self.results)
+            w.writerows(rows)
+        self.root.after(0, lambda: self.status.config(text=self.tr("export_done")))
 
 # ==========================================================
 # MAIN
@@ -638,6 +1200,9 @@ if __name__ == "__main__":
     Application entry point. Creates the main window with a dark theme
     and handles any uncaught exceptions by printing them and waiting for user input.
     """
+    # Required for the worker processes when running as a PyInstaller bundle;
+    # without it each worker would re-launch the GUI instead of probing files
+    multiprocessing.freeze_support()
     try:
         app = tb.Window(
             title=f"Dolby Atmos scanner - v{VERSION}",
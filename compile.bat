@@ -3,7 +3,7 @@ cd /d "%~dp0"
 
 echo Installing dependencies...
 python -m pip install --upgrade pip
-python -m pip install ttkbootstrap pyinstaller
+python -m pip install ttkbootstrap xxhash orjson msgspec av pyinstaller
 
 echo Cleaning old builds...
 rmdir /s /q build dist 2>nul